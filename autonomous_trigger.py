@@ -4,6 +4,7 @@ Autonomous Trigger System
 Memory-driven goal execution and proactive actions based on long-term objectives.
 """
 
+import atexit
 import json
 import os
 from datetime import datetime
@@ -12,11 +13,33 @@ class AutonomousTriggerSystem:
     def __init__(self):
         self.memory_file = "/home/admin/clawd/memory/MEMORY.md"
         self.trigger_log = "/home/admin/clawd/memory/autonomous_trigger_log.md"
+        # Pending log entries; written with a single open/write on flush_log()
+        self._log_buffer = []
+        atexit.register(self.flush_log)
+        # (mtime_ns, size, tail_bytes) -> content of the last MEMORY.md read
+        self._memory_cache = None
         
-    def check_memory_driven_goals(self):
-        """Check MEMORY.md for current goals and priorities"""
-        with open(self.memory_file, 'r') as f:
-            content = f.read()
+    def check_memory_driven_goals(self, tail_bytes=None):
+        """Check MEMORY.md for current goals and priorities
+
+        Pass tail_bytes to read only the most recent part of the file. The
+        result is cached on the file's mtime and size, so repeated checks
+        within one process skip the read while MEMORY.md is unchanged.
+        """
+        st = os.stat(self.memory_file)
+        key = (st.st_mtime_ns, st.st_size, tail_bytes)
+        if self._memory_cache is not None and self._memory_cache[0] == key:
+            return self._memory_cache[1]
+
+        with open(self.memory_file, 'rb') as f:
+            if tail_bytes and st.st_size > tail_bytes:
+                f.seek(-tail_bytes, os.SEEK_END)
+                # the cut may land inside a multi-byte character
+                content = f.read().decode('utf-8', errors='ignore')
+            else:
+                content = f.read().decode('utf-8')
+
+        self._memory_cache = (key, content)
         return content
         
     def execute_proactive_actions(self, goals):
@@ -28,12 +51,21 @@ class AutonomousTriggerSystem:
         # - Cross-project coordination
         pass
         
-    def log_execution(self, actions):
-        """Log autonomous trigger execution"""
+    def log_execution(self, actions, flush=False):
+        """Log autonomous trigger execution (buffered until flush_log or exit)"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._log_buffer.append(f"## {timestamp}\n{actions}\n\n")
+        if flush:
+            self.flush_log()
+
+    def flush_log(self):
+        """Write all buffered log entries to the trigger log in one append"""
+        if not self._log_buffer:
+            return
+        entries = ''.join(self._log_buffer)
+        self._log_buffer.clear()
         with open(self.trigger_log, 'a') as f:
-            f.write(f"## {timestamp}\n")
-            f.write(f"{actions}\n\n")
+            f.write(entries)
 
 if __name__ == "__main__":
     trigger = AutonomousTriggerSystem()
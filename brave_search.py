@@ -2,15 +2,106 @@
 import os
 import sys
 import json
+import queue
+import random
 import argparse
-from time import sleep
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from time import monotonic, sleep
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decode/encode
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: incremental decode of the response stream
+    ijson = None
 
 API_URL = "https://api.search.brave.com/res/v1/web/search"
 MAX_RETRIES = 3
 BACKOFF_FACTOR = 2  # 2s, 4s, 8s...
+MAX_WORKERS = 8  # concurrent queries in CLI multi-query mode
+HEDGE_DELAY_MS = int(os.environ.get("BRAVE_HEDGE_DELAY_MS", "2000"))  # paid-key head start before hedging on a slow (not failing) request
+QPS_LIMIT = float(os.environ.get("BRAVE_QPS_LIMIT", "5"))  # per-key request rate, shared by all threads
+
+# One pooled, keep-alive session per process so repeated queries reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+
+
+class _TokenBucket:
+    """Per-key rate limiter shared by all worker threads.
+
+    Tokens refill continuously at `rate` per second. A 429 halves the rate
+    (down to `min_rate`); each success adds back a tenth of the configured
+    rate, so throughput adapts to the key's real limit (AIMD).
+    """
+
+    def __init__(self, rate: float, min_rate: float = 0.25):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.tokens = max(1.0, rate)
+        self.updated = monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, cancel=None) -> bool:
+        """Take one token, waiting as needed; returns False if `cancel` is set while waiting."""
+        while True:
+            if cancel is not None and cancel.is_set():
+                return False
+            with self.lock:
+                now = monotonic()
+                capacity = max(1.0, self.rate)
+                self.tokens = min(capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            _pause(wait, cancel)
+
+    def on_success(self):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+
+    def on_throttled(self):
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, max(1.0, self.rate))
+
+
+_BUCKETS = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def _bucket_for(api_key: str) -> _TokenBucket:
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(api_key)
+        if bucket is None:
+            bucket = _BUCKETS[api_key] = _TokenBucket(QPS_LIMIT)
+        return bucket
+
+
+def _pause(seconds: float, cancel=None) -> bool:
+    """Sleep for `seconds`, waking early if `cancel` is set; returns True if cancelled."""
+    if cancel is None:
+        sleep(seconds)
+        return False
+    return cancel.wait(seconds)
+
+
+def _jittered(wait_time: float) -> float:
+    """Spread retries over [0.5, 1.5) x wait so throttled threads do not retry in lockstep."""
+    return wait_time * (0.5 + random.random())
+
 
 CREDS_PATHS = [
     Path(os.path.expanduser("~/.config/brave_search/credentials.json")),
@@ -18,6 +109,7 @@ CREDS_PATHS = [
 ]
 
 
+@lru_cache(maxsize=1)
 def _load_credentials_file():
     for p in CREDS_PATHS:
         try:
@@ -28,8 +120,41 @@ def _load_credentials_file():
     return {}
 
 
+def _loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _iter_web_results(resp):
+    """Yield `web.results` items, decoding incrementally as bytes arrive when ijson is available."""
+    if ijson is not None:
+        resp.raw.decode_content = True  # let urllib3 undo gzip before ijson sees the bytes
+        yield from ijson.items(resp.raw, "web.results.item")
+        return
+
+    data = _loads(resp.content)
+    web = data.get("web") or {}
+    yield from web.get("results") or []
+
+
+def _emit(obj):
+    """Write one JSON document per line to stdout (UTF-8, non-ASCII kept as-is)."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(obj, ensure_ascii=False))
+
+
+@lru_cache(maxsize=1)
 def _get_keys():
-    """Return (paid_key, free_key) without ever printing them."""
+    """Return (paid_key, free_key) without ever printing them.
+
+    Resolved once per process; call `_get_keys.cache_clear()` (and
+    `_load_credentials_file.cache_clear()`) to pick up rotated keys.
+    """
     creds = _load_credentials_file()
 
     paid = (
@@ -50,110 +175,192 @@ def _get_keys():
     return paid, free
 
 
-def _search_with_key(query: str, count: int, api_key: str):
+def _search_with_key(query: str, count: int, api_key: str, cancel=None, retrying=None, started=None):
+    """Query with one key, retrying 429/5xx with backoff.
+
+    `cancel` (threading.Event) abandons the attempt before the next request,
+    during backoff or while waiting for a rate-limit token. `retrying` is set
+    as soon as the key is throttled or failing, so a hedging caller can
+    bring in the other key without waiting out the backoff. `started` is set
+    once a rate-limit token has been taken and the request is about to go out.
+    """
+    cancelled = (None, {"kind": "cancelled"})
     headers = {
         "X-Subscription-Token": api_key,
         "Accept": "application/json",
         "Accept-Encoding": "gzip",
+        "Connection": "keep-alive",
     }
 
     params = {"q": query, "count": count}
 
+    bucket = _bucket_for(api_key)
+
     retry_count = 0
     while retry_count <= MAX_RETRIES:
+        if cancel is not None and cancel.is_set():
+            return cancelled
         try:
-            resp = requests.get(API_URL, headers=headers, params=params, timeout=10)
-
-            if resp.status_code == 200:
-                data = resp.json()
-                results = []
-                for item in (data.get("web", {}) or {}).get("results", []) or []:
-                    results.append(
+            if not bucket.acquire(cancel):
+                return cancelled
+            if started is not None:
+                started.set()
+            with _SESSION.get(API_URL, headers=headers, params=params, timeout=10, stream=True) as resp:
+                status = resp.status_code
+
+                if status == 200:
+                    bucket.on_success()
+                    get = dict.get
+                    results = [
                         {
-                            "title": item.get("title"),
-                            "url": item.get("url"),
-                            "description": item.get("description"),
-                            "age": item.get("age", ""),
+                            "title": get(item, "title"),
+                            "url": get(item, "url"),
+                            "description": get(item, "description"),
+                            "age": get(item, "age", ""),
                         }
-                    )
-                return {"success": True, "query": query, "results": results}, None
-
-            # key-level failures: let caller try fallback key
-            if resp.status_code in (401, 403):
-                return None, {"kind": "auth", "status": resp.status_code}
-
-            if resp.status_code == 429:
+                        for item in _iter_web_results(resp)
+                    ]
+                    return {"success": True, "query": query, "results": results}, None
+
+                # key-level failures: let caller try fallback key
+                if status in (401, 403):
+                    return None, {"kind": "auth", "status": status}
+
+                # other non-retriable errors
+                if status != 429 and status < 500:
+                    sys.stderr.write(f"API Error {status}: {resp.text[:200]}\n")
+                    return None, {"kind": "api", "status": status}
+
+            # retriable: the response is closed before backing off
+            if retrying is not None:
+                retrying.set()
+            if cancel is not None and cancel.is_set():
+                return cancelled
+            if status == 429:
                 # we still do a short backoff a few times; if it persists, caller may try fallback key
-                wait_time = (BACKOFF_FACTOR**retry_count) + 1
-                sys.stderr.write(f"Rate limited (429). Retrying in {wait_time}s...\n")
-                sleep(wait_time)
-                retry_count += 1
-                continue
-
-            # 5xx: retry with backoff
-            if resp.status_code >= 500:
-                wait_time = BACKOFF_FACTOR**retry_count
-                sys.stderr.write(f"API Error {resp.status_code}. Retrying in {wait_time}s...\n")
-                sleep(wait_time)
-                retry_count += 1
-                continue
-
-            # other non-retriable errors
-            sys.stderr.write(f"API Error {resp.status_code}: {resp.text[:200]}\n")
-            return None, {"kind": "api", "status": resp.status_code}
+                bucket.on_throttled()
+                wait_time = _jittered((BACKOFF_FACTOR**retry_count) + 1)
+                sys.stderr.write(f"Rate limited (429). Retrying in {wait_time:.1f}s...\n")
+            else:
+                # 5xx: retry with backoff
+                wait_time = _jittered(BACKOFF_FACTOR**retry_count)
+                sys.stderr.write(f"API Error {status}. Retrying in {wait_time:.1f}s...\n")
+            if _pause(wait_time, cancel):
+                return cancelled
+            retry_count += 1
 
         except Exception as e:
+            if retrying is not None:
+                retrying.set()
+            if cancel is not None and cancel.is_set():
+                return cancelled
             sys.stderr.write(f"Request failed: {e}\n")
-            sleep(1)
+            if _pause(_jittered(1), cancel):
+                return cancelled
             retry_count += 1
 
     return None, {"kind": "rate_or_api", "status": 429}
 
 
-def search(query: str, count: int = 10):
+def _hedged_search(query: str, count: int, paid: str, free: str):
+    """Hedged request: paid key first; the free key is launched only once the paid
+    attempt has failed, starts retrying (429/5xx/network error), or has not
+    finished within HEDGE_DELAY_MS of leaving the local rate limiter (time
+    queued on the per-key token bucket does not count as the key struggling).
+
+    Returns (tier, data, last_err) for whichever attempt succeeds first. The
+    other attempt is cancelled via a shared Event, so it stops at its next
+    retry, backoff or rate-limit wait. Attempts run on daemon threads, so a
+    loser still blocked in an HTTP read does not hold up interpreter exit.
+    """
+    cancel = threading.Event()
+    hedge_now = threading.Event()
+    paid_started = threading.Event()
+    outcomes = queue.Queue()
+
+    def attempt(tier, api_key, retrying=None, started=None):
+        # exactly one outcome per attempt, so the collecting loop below never blocks forever
+        try:
+            outcome = _search_with_key(query, count, api_key, cancel, retrying, started)
+        except Exception as e:
+            outcome = (None, {"kind": "error", "detail": str(e)})
+        outcomes.put((tier, outcome))
+        hedge_now.set()
+        if started is not None:
+            started.set()
+
+    try:
+        threading.Thread(target=attempt, args=("paid", paid, hedge_now, paid_started), daemon=True).start()
+        pending = 1
+        paid_started.wait()  # the hedge clock starts once the paid request holds its token
+        hedge_now.wait(HEDGE_DELAY_MS / 1000)
+        last_err = None
+        if not outcomes.empty():
+            pending -= 1
+            tier, (data, last_err) = outcomes.get()
+            if data:
+                return tier, data, None
+
+        threading.Thread(target=attempt, args=("free", free), daemon=True).start()
+        pending += 1
+        while pending:
+            tier, (data, err) = outcomes.get()
+            pending -= 1
+            if data:
+                return tier, data, None
+            last_err = err
+        return None, None, last_err
+    finally:
+        cancel.set()
+
+
+def search_result(query: str, count: int = 10):
+    """Run one query (paid key first, free key as hedged fallback) and return the JSON-able result."""
     paid, free = _get_keys()
 
     if not paid and not free:
-        print(json.dumps({"success": False, "error": "Missing Brave API key(s)", "downgrade": True}))
+        return {"success": False, "error": "Missing Brave API key(s)", "downgrade": True}
+
+    if paid and free:
+        tier, data, last_err = _hedged_search(query, count, paid, free)
+    else:
+        tier = "paid" if paid else "free"
+        data, last_err = _search_with_key(query, count, paid or free)
+
+    if data:
+        data["tier"] = tier
+        return data
+
+    return {
+        "success": False,
+        "query": query,
+        "error": "Brave Search failed after trying all keys",
+        "last_error": last_err,
+        "downgrade": True,
+    }
+
+
+def search(query: str, count: int = 10):
+    _emit(search_result(query, count))
+
+
+def search_many(queries, count: int = 10, max_workers: int = MAX_WORKERS):
+    """Run several queries concurrently on the shared session; yields results in input order."""
+    if len(queries) <= 1:
+        yield from (search_result(q, count) for q in queries)
         return
 
-    attempts = []
-
-    if paid:
-        attempts.append(("paid", paid))
-    if free:
-        attempts.append(("free", free))
-
-    last_err = None
-    for tier, key in attempts:
-        data, err = _search_with_key(query, count, key)
-        if data:
-            data["tier"] = tier
-            print(json.dumps(data, ensure_ascii=False))
-            return
-
-        last_err = err
-        # If we got here: try next key (fallback)
-
-    print(
-        json.dumps(
-            {
-                "success": False,
-                "query": query,
-                "error": "Brave Search failed after trying all keys",
-                "last_error": last_err,
-                "downgrade": True,
-            },
-            ensure_ascii=False,
-        )
-    )
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as ex:
+        yield from ex.map(lambda q: search_result(q, count), queries)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Brave Search (paid-first, free-fallback) with Retry/Backoff")
     parser.add_argument("queries", nargs="+", help="Search query (or queries)")
     parser.add_argument("--count", type=int, default=10, help="Number of results")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Max concurrent queries")
     args = parser.parse_args()
 
-    for q in args.queries:
-        search(q, args.count)
+    # results are emitted from the main thread, in query order, as they become ready
+    for result in search_many(args.queries, args.count, max(1, args.workers)):
+        _emit(result)
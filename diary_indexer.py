@@ -8,98 +8,158 @@ Automatically generates metadata index for diary files
 - 生成YAML frontmatter
 - 支持中文和英文内容
 - 与Sherwen_Life_System集成
+- 多进程并行处理日记文件
 
 Usage:
     python diary_indexer.py --input /path/to/diaries --output /path/to/index
 """
 
+import mmap
 import os
 import re
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+try:
+    from yaml import CSafeDumper as YamlDumper  # libyaml 加速
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+# 技术相关关键词
+TECH_KEYWORDS = ['code', 'bug', 'programming', '开发', '代码', '调试']
+# 生活相关关键词
+LIFE_KEYWORDS = ['basketball', 'guitar', 'interview', '篮球', '吉他', '面试']
+
+# 直接在 UTF-8 字节上匹配（英文关键词按 ASCII 忽略大小写，中文无大小写之分）
+KEYWORD_BYTES_RE = re.compile(
+    b'|'.join(re.escape(k.encode('utf-8')) for k in TECH_KEYWORDS + LIFE_KEYWORDS),
+    re.IGNORECASE,
+)
+_KEYWORD_BY_LOWER_BYTES = {k.lower().encode('utf-8'): k for k in TECH_KEYWORDS + LIFE_KEYWORDS}
+
+# 小于该大小的文件直接读入，更大的文件使用 mmap
+MMAP_THRESHOLD = 64 * 1024
+
+
+def find_keywords(content):
+    """单次扫描返回内容中出现过的全部关键词集合（content 为 UTF-8 的 bytes 或 mmap）"""
+    return {_KEYWORD_BY_LOWER_BYTES[m.group(0).lower()] for m in KEYWORD_BYTES_RE.finditer(content)}
+
+
+def extract_metadata(content, file_path):
+    """从日记内容中提取元数据"""
+    metadata = {
+        'date': file_path.stem,
+        'year': file_path.parent.parent.name if file_path.parent.parent.name.isdigit() else '',
+        'month': file_path.parent.name if file_path.parent.name.replace('-', '').isdigit() else '',
+        'themes': [],
+        'keywords': [],
+        'mood': '',
+        'importance': 0,
+        'summary': '',
+        'projects': [],
+        'tasks_completed': [],
+        'tasks_planned': []
+    }
+
+    # 简单的关键词提取：一次扫描得到全部命中，再按各类别列表顺序各取第一个
+    hits = find_keywords(content)
+    keywords = []
+
+    for category_keywords in (TECH_KEYWORDS, LIFE_KEYWORDS):
+        for keyword in category_keywords:
+            if keyword in hits:
+                keywords.append(keyword)
+                break
+
+    metadata['keywords'] = keywords[:3]  # 最多3个关键词
+    metadata['summary'] = f"日记内容包含 {len(keywords)} 个主要主题"
+
+    return metadata
+
+
+def process_diary_file(file_path, output_dir):
+    """处理单个日记文件（模块级函数，便于在子进程中执行）"""
+    file_path = Path(file_path)
+    try:
+        # 以字节形式扫描，无需解码为 str；大文件通过 mmap 由页缓存直接提供
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    metadata = extract_metadata(content, file_path)
+            else:
+                metadata = extract_metadata(f.read(), file_path)
+
+        # 生成索引文件
+        index_file = Path(output_dir) / f"{file_path.stem}_index.yaml"
+        with open(index_file, 'w', encoding='utf-8') as f:
+            yaml.dump(metadata, f, Dumper=YamlDumper, allow_unicode=True, default_flow_style=False)
+
+        print(f"✓ 已处理: {file_path.name}")
+        return True
+
+    except Exception as e:
+        print(f"✗ 处理失败 {file_path.name}: {e}")
+        return False
+
+
+def iter_markdown_files(root):
+    """基于 os.scandir 的迭代式目录遍历，逐个产出 .md 文件路径（不跟随符号链接）"""
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        yield entry.path
+        except OSError as e:
+            print(f"✗ 无法读取目录 {current}: {e}")
+
+
 class DiaryIndexer:
-    def __init__(self, input_dir, output_dir):
+    def __init__(self, input_dir, output_dir, max_workers=None):
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-    
+        self.max_workers = max_workers or os.cpu_count()
+
     def extract_metadata(self, content, file_path):
-        """从日记内容中提取元数据"""
-        metadata = {
-            'date': file_path.stem,
-            'year': file_path.parent.parent.name if file_path.parent.parent.name.isdigit() else '',
-            'month': file_path.parent.name if file_path.parent.name.replace('-', '').isdigit() else '',
-            'themes': [],
-            'keywords': [],
-            'mood': '',
-            'importance': 0,
-            'summary': '',
-            'projects': [],
-            'tasks_completed': [],
-            'tasks_planned': []
-        }
-        
-        # 简单的关键词提取
-        content_lower = content.lower()
-        keywords = []
-        
-        # 技术相关关键词
-        tech_keywords = ['code', 'bug', 'programming', '开发', '代码', '调试']
-        for keyword in tech_keywords:
-            if keyword in content_lower:
-                keywords.append(keyword)
-                break
-        
-        # 生活相关关键词  
-        life_keywords = ['basketball', 'guitar', 'interview', '篮球', '吉他', '面试']
-        for keyword in life_keywords:
-            if keyword in content_lower:
-                keywords.append(keyword)
-                break
-                
-        metadata['keywords'] = keywords[:3]  # 最多3个关键词
-        metadata['summary'] = f"日记内容包含 {len(keywords)} 个主要主题"
-        
-        return metadata
-    
+        """从日记内容中提取元数据（content 为 str 时先编码为 UTF-8）"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return extract_metadata(content, file_path)
+
     def process_diary_file(self, file_path):
         """处理单个日记文件"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            metadata = self.extract_metadata(content, file_path)
-            
-            # 生成索引文件
-            index_file = self.output_dir / f"{file_path.stem}_index.yaml"
-            with open(index_file, 'w', encoding='utf-8') as f:
-                yaml.dump(metadata, f, allow_unicode=True, default_flow_style=False)
-                
-            print(f"✓ 已处理: {file_path.name}")
-            
-        except Exception as e:
-            print(f"✗ 处理失败 {file_path.name}: {e}")
-    
+        return process_diary_file(file_path, self.output_dir)
+
     def run(self):
-        """运行索引器"""
+        """运行索引器（每个文件独立处理，分发到进程池并行执行）"""
         print("开始处理日记文件...")
-        diary_files = list(self.input_dir.rglob("*.md"))
-        
-        for file_path in diary_files:
-            self.process_diary_file(file_path)
-            
-        print(f"完成! 共处理 {len(diary_files)} 个文件")
+        diary_files = iter_markdown_files(self.input_dir)
+
+        worker = partial(process_diary_file, output_dir=self.output_dir)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            processed = sum(1 for _ in executor.map(worker, diary_files, chunksize=16))
+
+        print(f"完成! 共处理 {processed} 个文件")
 
 if __name__ == "__main__":
     import argparse
-    
+
     parser = argparse.ArgumentParser(description='Diary Indexer - 自动为日记文件生成元数据索引')
     parser.add_argument('--input', required=True, help='日记文件输入目录')
     parser.add_argument('--output', required=True, help='索引文件输出目录')
-    
+    parser.add_argument('--workers', type=int, default=None, help='并行进程数（默认: CPU 核心数）')
+
     args = parser.parse_args()
-    
-    indexer = DiaryIndexer(args.input, args.output)
-    indexer.run()
\ No newline at end of file
+
+    indexer = DiaryIndexer(args.input, args.output, max_workers=args.workers)
+    indexer.run()
@@ -46,27 +46,25 @@ def optimize_memory_system():
     
     # Create optimization log
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_content = f"""# Memory System Optimization Log - {timestamp} GMT+8
+    log_parts = [f"""# Memory System Optimization Log - {timestamp} GMT+8
 
 ## Current Memory System Design Analysis
 The memory system has evolved into a sophisticated, multi-layered architecture that successfully integrates autonomous trigger mechanisms, proactive monitoring, and systematic documentation.
 
 ### Core Functional Integrations (Working Effectively)
-"""
+"""]
     
-    for i, integration in enumerate(integrations, 1):
-        log_content += f"{i}. **{integration}**\n"
+    log_parts.extend(f"{i}. **{integration}**\n" for i, integration in enumerate(integrations, 1))
     
-    log_content += "\n## LLM-Enhanced Improvements Identified\n"
-    for i, enhancement in enumerate(enhancements, 1):
-        log_content += f"{i}. **{enhancement}**\n"
+    log_parts.append("\n## LLM-Enhanced Improvements Identified\n")
+    log_parts.extend(f"{i}. **{enhancement}**\n" for i, enhancement in enumerate(enhancements, 1))
     
-    log_content += f"\n*Optimization completed at {timestamp} GMT+8*\n"
+    log_parts.append(f"\n*Optimization completed at {timestamp} GMT+8*\n")
     
     # Save to memory directory
     log_file = f"/home/admin/clawd/memory/memory_optimization_log_{datetime.now().strftime('%Y-%m-%d_%H%M')}.md"
     with open(log_file, 'w') as f:
-        f.write(log_content)
+        f.write(''.join(log_parts))
     
     print(f"📝 Optimization log saved to {log_file}")
     print("✅ Memory system optimization completed!")
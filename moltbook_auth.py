@@ -28,6 +28,8 @@ class MoltbookAuth:
         self.app_api_key = app_api_key
         self.audience = audience or "clawdhub.com"
         self.verify_url = "https://www.moltbook.com/api/v1/agents/verify-identity"
+        # Reused across verifications so the TLS connection stays alive
+        self.session = requests.Session()
     
     def verify_identity_token(self, identity_token: str) -> Dict[str, Any]:
         """
@@ -41,7 +43,8 @@ class MoltbookAuth:
         """
         headers = {
             'Content-Type': 'application/json',
-            'X-Moltbook-App-Key': self.app_api_key
+            'X-Moltbook-App-Key': self.app_api_key,
+            'Connection': 'keep-alive'
         }
         
         payload = {
@@ -53,7 +56,7 @@ class MoltbookAuth:
             payload['audience'] = self.audience
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.verify_url,
                 headers=headers,
                 json=payload,
@@ -1,29 +1,54 @@
 #!/usr/bin/env python3
 import json
 import os
+import shutil
 import subprocess
 import time
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional: faster parse of large session stores
+    orjson = None
+
 # Configuration (override via environment variables)
 # Example:
 #   export CLAWDBOT_SESSIONS_JSON="$HOME/.clawdbot/agents/main/sessions/sessions.json"
 #   export CLAWDBOT_TARGET_SESSION_KEY="agent:main:main"
 SESSIONS_JSON = os.path.expanduser(os.environ.get('CLAWDBOT_SESSIONS_JSON', '~/.clawdbot/agents/main/sessions/sessions.json'))
 TARGET_SESSION_KEY = os.environ.get('CLAWDBOT_TARGET_SESSION_KEY', 'agent:main:main')  # main session by default
+# Resolved once so the restart does not rescan PATH; falls back to a PATH lookup at exec time
+MOLTBOT_BIN = shutil.which('moltbot') or 'moltbot'
 
 def log(msg):
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     print(f"[{timestamp}] {msg}")
 
+# ((path, st_mtime_ns, st_size), parsed sessions.json) of the last load
+_SESSIONS_CACHE = None
+
+def load_sessions():
+    """Parse sessions.json, reusing the last parse while the file is unchanged."""
+    global _SESSIONS_CACHE
+    st = os.stat(SESSIONS_JSON)
+    key = (SESSIONS_JSON, st.st_mtime_ns, st.st_size)
+    if _SESSIONS_CACHE is not None and _SESSIONS_CACHE[0] == key:
+        return _SESSIONS_CACHE[1]
+
+    with open(SESSIONS_JSON, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    _SESSIONS_CACHE = (key, data)
+    return data
+
 def refresh_session():
     if not os.path.exists(SESSIONS_JSON):
         log(f"Error: {SESSIONS_JSON} not found.")
         return
 
     try:
-        with open(SESSIONS_JSON, 'r') as f:
-            data = json.load(f)
+        data = load_sessions()
 
         session = data.get(TARGET_SESSION_KEY)
         if not session:
@@ -46,7 +71,7 @@ def refresh_session():
 
         # Restart gateway to apply changes
         log("Restarting gateway...")
-        subprocess.run(['moltbot', 'gateway', 'restart'], check=True)
+        subprocess.run([MOLTBOT_BIN, 'gateway', 'restart'], check=True)
         log("Gateway restart signal sent.")
 
     except Exception as e:
@@ -2,16 +2,144 @@
 """
 Content filtering script for social platform safety.
 This script helps identify and filter out harmful, misleading, or诱导性 content.
+
+When the optional ``hyperscan`` package is installed, all patterns are
+compiled into a single Hyperscan database and ASCII text is scanned in one
+pass; otherwise the precompiled ``re`` patterns below are used.
 """
 
 import re
 import json
-from typing import Dict, List, Tuple
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Advertising detection patterns
+AD_PATTERNS = [
+    r'\b(best|top|ultimate|amazing|incredible)\s+\w+\s+(product|tool|service)\b',
+    r'\b(revolutionary|game-changing|breakthrough)\b',
+    r'\b(click here|learn more|sign up now|limited time)\b',
+    r'\b(100%|guaranteed|risk-free|no obligation)\b'
+]
+
+# Dangerous instructions patterns
+DANGEROUS_PATTERNS = [
+    r'\b(hack|exploit|bypass security|circumvent)\b',
+    r'\b(illegal|unauthorized|steal|pirate)\b',
+    r'\b(dangerous|harmful|risky|unsafe)\s+.*\b(try|attempt|do)\b',
+    r'\b(weapon|explosive|chemical|toxic)\b.*\b(make|create|build)\b'
+]
+
+# Manipulative language patterns
+MANIPULATIVE_PATTERNS = [
+    r'\b(you must|everyone should|no one else|only we)\b',
+    r'\b(fear|scare|panic|emergency)\b.*\b(act now|immediately)\b',
+    r'\b(secret|hidden|exclusive|insider)\b.*\b(knowledge|information|access)\b'
+]
+
+
+def _compile_category(patterns: List[str]) -> Tuple[re.Pattern, List[re.Pattern]]:
+    """Compile a pattern category once: a fused alternation plus the individual patterns."""
+    combined = re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+    return combined, [re.compile(p, re.IGNORECASE) for p in patterns]
+
+
+AD_RE, AD_RES = _compile_category(AD_PATTERNS)
+DANGEROUS_RE, DANGEROUS_RES = _compile_category(DANGEROUS_PATTERNS)
+MANIPULATIVE_RE, MANIPULATIVE_RES = _compile_category(MANIPULATIVE_PATTERNS)
+
+
+def _category_score(combined: re.Pattern, compiled: List[re.Pattern], text: str) -> int:
+    """
+    Count how many patterns of a category match the text.
+
+    Clean text (the common case) is rejected by a single scan of the fused
+    regex; only when it hits are the individual patterns checked, so the
+    score still counts distinct matching patterns.
+    """
+    if not combined.search(text):
+        return 0
+    return sum(1 for pattern in compiled if pattern.search(text))
+
+
+# No pattern can match fewer characters than this ('hack'), so shorter text is clean
+MIN_MATCH_LENGTH = 4
+
+PATTERN_CATEGORIES = {
+    'advertising': AD_PATTERNS,
+    'dangerous_instructions': DANGEROUS_PATTERNS,
+    'manipulative_language': MANIPULATIVE_PATTERNS,
+}
+
+
+def _build_hyperscan_db():
+    """Compile every category into one Hyperscan database, or None if unavailable."""
+    if hyperscan is None:
+        return None, []
+
+    expressions = []
+    categories = []
+    for category, patterns in PATTERN_CATEGORIES.items():
+        for pattern in patterns:
+            expressions.append(pattern.encode('utf-8'))
+            categories.append(category)
+
+    # SINGLEMATCH reports each pattern at most once, so a score is still the
+    # number of distinct matching patterns
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[flags] * len(expressions),
+        )
+    except hyperscan.error:
+        return None, []
+    return db, categories
+
+
+HS_DB, HS_CATEGORIES = _build_hyperscan_db()
+
+
+def _hyperscan_scores(text: str) -> Optional[Dict[str, int]]:
+    """
+    Score all categories in a single Hyperscan pass.
+
+    Returns None when Hyperscan is unavailable or the text is not pure ASCII:
+    Hyperscan cannot combine word boundaries with Unicode properties, so its
+    word classes are ASCII-only and would disagree with ``re`` on e.g. Chinese
+    text.
+    """
+    if HS_DB is None or not text.isascii():
+        return None
 
-def detect_harmful_content(text: str) -> Dict[str, any]:
+    scores = dict.fromkeys(PATTERN_CATEGORIES, 0)
+
+    def on_match(pattern_id, start, end, flags, context):
+        scores[HS_CATEGORIES[pattern_id]] += 1
+
+    try:
+        HS_DB.scan(text.encode('ascii'), match_event_handler=on_match)
+    except hyperscan.error:
+        return None
+    return scores
+
+
+def detect_harmful_content(text: str, full: bool = False) -> Dict[str, any]:
     """
     Detect various types of harmful content in text.
     
+    Dangerous instructions force ``should_block`` on their own, so they are
+    checked first and the remaining categories are skipped once one is found.
+    Pass ``full=True`` to always score every category.
+    
     Returns a dictionary with detection results and confidence scores.
     """
     results = {
@@ -23,53 +151,42 @@ def detect_harmful_content(text: str) -> Dict[str, any]:
         'confidence_scores': {}
     }
     
-    # Advertising detection patterns
-    ad_patterns = [
-        r'\b(best|top|ultimate|amazing|incredible)\s+\w+\s+(product|tool|service)\b',
-        r'\b(revolutionary|game-changing|breakthrough)\b',
-        r'\b(click here|learn more|sign up now|limited time)\b',
-        r'\b(100%|guaranteed|risk-free|no obligation)\b'
-    ]
-    
-    # Dangerous instructions patterns
-    dangerous_patterns = [
-        r'\b(hack|exploit|bypass security|circumvent)\b',
-        r'\b(illegal|unauthorized|steal|pirate)\b',
-        r'\b(dangerous|harmful|risky|unsafe)\s+.*\b(try|attempt|do)\b',
-        r'\b(weapon|explosive|chemical|toxic)\b.*\b(make|create|build)\b'
-    ]
-    
-    # Manipulative language patterns
-    manipulative_patterns = [
-        r'\b(you must|everyone should|no one else|only we)\b',
-        r'\b(fear|scare|panic|emergency)\b.*\b(act now|immediately)\b',
-        r'\b(secret|hidden|exclusive|insider)\b.*\b(knowledge|information|access)\b'
-    ]
-    
+    if len(text) < MIN_MATCH_LENGTH:
+        hs_scores = dict.fromkeys(PATTERN_CATEGORIES, 0)
+    else:
+        hs_scores = _hyperscan_scores(text)
+
+    # Check dangerous patterns
+    if hs_scores is not None:
+        dangerous_score = hs_scores['dangerous_instructions']
+    else:
+        dangerous_score = _category_score(DANGEROUS_RE, DANGEROUS_RES, text)
+
+    results['dangerous_instructions'] = dangerous_score > 0
+    dangerous_confidence = min(dangerous_score * 0.4, 1.0)
+
+    if results['dangerous_instructions'] and not full:
+        results['confidence_scores']['dangerous_instructions'] = dangerous_confidence
+        results['overall_risk'] = dangerous_confidence
+        results['should_block'] = True
+        return results
+
     # Check advertising patterns
-    ad_score = 0
-    for pattern in ad_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            ad_score += 1
-    
+    if hs_scores is not None:
+        ad_score = hs_scores['advertising']
+    else:
+        ad_score = _category_score(AD_RE, AD_RES, text)
+
     results['advertising'] = ad_score >= 2
     results['confidence_scores']['advertising'] = min(ad_score * 0.3, 1.0)
-    
-    # Check dangerous patterns
-    dangerous_score = 0
-    for pattern in dangerous_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            dangerous_score += 1
-    
-    results['dangerous_instructions'] = dangerous_score > 0
-    results['confidence_scores']['dangerous_instructions'] = min(dangerous_score * 0.4, 1.0)
-    
+    results['confidence_scores']['dangerous_instructions'] = dangerous_confidence
+
     # Check manipulative patterns
-    manipulative_score = 0
-    for pattern in manipulative_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            manipulative_score += 1
-    
+    if hs_scores is not None:
+        manipulative_score = hs_scores['manipulative_language']
+    else:
+        manipulative_score = _category_score(MANIPULATIVE_RE, MANIPULATIVE_RES, text)
+
     results['manipulative_language'] = manipulative_score >= 2
     results['confidence_scores']['manipulative_language'] = min(manipulative_score * 0.35, 1.0)
     
@@ -79,6 +196,27 @@ def detect_harmful_content(text: str) -> Dict[str, any]:
     
     return results
 
+# Analyses of recently seen content, keyed by a BLAKE2 digest so the cache
+# does not keep the (possibly long) posts themselves alive
+ANALYSIS_CACHE_SIZE = 4096
+_ANALYSIS_CACHE: "OrderedDict[bytes, Dict[str, any]]" = OrderedDict()
+
+
+def _cached_analysis(content: str) -> Dict[str, any]:
+    """detect_harmful_content() memoized on a content hash, for repeated posts."""
+    key = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+    analysis = _ANALYSIS_CACHE.get(key)
+    if analysis is None:
+        analysis = detect_harmful_content(content)
+        _ANALYSIS_CACHE[key] = analysis
+        if len(_ANALYSIS_CACHE) > ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+    else:
+        _ANALYSIS_CACHE.move_to_end(key)
+    # hand out a copy so callers cannot alter the cached entry
+    return dict(analysis, confidence_scores=dict(analysis['confidence_scores']))
+
+
 def filter_social_content(content: str, platform: str = "moltbook") -> Dict[str, any]:
     """
     Main function to filter social platform content.
@@ -90,7 +228,7 @@ def filter_social_content(content: str, platform: str = "moltbook") -> Dict[str,
     Returns:
         Dictionary with analysis results and recommendations
     """
-    analysis = detect_harmful_content(content)
+    analysis = _cached_analysis(content)
     
     result = {
         'platform': platform,
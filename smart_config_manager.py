@@ -13,6 +13,7 @@
 - 配置版本历史追踪
 - 环境变量集成
 - 配置模板生成
+- 解析结果缓存（按路径+修改时间+大小，未改动的 YAML/TOML/INI 无需重复解析）
 
 使用方法：
     python smart_config_manager.py --help
@@ -20,23 +21,176 @@
 
 import argparse
 import json
-import yaml
-import toml
 import configparser
 import os
+import re
 import sys
 import hashlib
 import base64
+import pickle
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from functools import lru_cache
 import shutil
 
+try:
+    import orjson  # 可选：更快的 JSON 解析
+except ImportError:
+    orjson = None
+
+
+# 以下较重的依赖按需导入：只处理 JSON 时不必付出 yaml/numpy 等的导入开销
+
+@lru_cache(maxsize=None)
+def _yaml_support():
+    """导入 PyYAML，返回 (yaml, Loader, Dumper)，优先使用 libyaml 加速的 C 实现"""
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """导入 NumPy（可选，用于向量化加解密），未安装时返回 None"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@lru_cache(maxsize=None)
+def _aesgcm():
+    """导入 cryptography 的 AES-GCM（可选，AES-NI 加速），返回 (AESGCM, InvalidTag)，未安装时为 (None, None)"""
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        from cryptography.exceptions import InvalidTag
+    except ImportError:
+        return None, None
+    return AESGCM, InvalidTag
+
+
+# 解析缓存目录（按用户隔离，权限 0700，避免加载他人写入的 pickle）
+PARSE_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'clawtools' / 'config_parse'
+
+# ${VAR_NAME} 格式的环境变量占位符
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# 解析缓存未命中的标记（缓存的配置本身可能是 None）
+_CACHE_MISS = object()
+
+# Marker passed as the key for list items in _rebuild_tree
+_LIST_ITEM = object()
+
+
+def _rebuild_tree(data: Any, leaf) -> Any:
+    """
+    迭代（非递归）地重建嵌套的 dict/list 结构
+
+    每个非容器值替换为 leaf(key, value)；列表元素的 key 为 _LIST_ITEM。
+    使用显式栈，每个节点只访问一次，不受递归深度限制。
+    """
+    if not isinstance(data, (dict, list)):
+        return leaf(_LIST_ITEM, data)
+
+    root = {} if isinstance(data, dict) else [None] * len(data)
+    stack = [(data, root)]
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            items = src.items()
+        else:
+            items = enumerate(src)
+        for key, value in items:
+            if isinstance(value, dict):
+                child = dst[key] = {}
+                stack.append((value, child))
+            elif isinstance(value, list):
+                child = dst[key] = [None] * len(value)
+                stack.append((value, child))
+            else:
+                dst[key] = leaf(key if isinstance(src, dict) else _LIST_ITEM, value)
+    return root
+
+
+def _xor_keystream(data: bytes, pwd: str) -> bytes:
+    """
+    以 SHA-256(密码) 循环作为密钥流，对字节逐位异或（加密与解密为同一操作）
+
+    有 NumPy 时整段向量化计算，否则逐字节处理。
+    """
+    key = hashlib.sha256(pwd.encode()).digest()
+    np = _numpy()
+    if np is not None:
+        buf = np.frombuffer(data, dtype=np.uint8)
+        keystream = np.resize(np.frombuffer(key, dtype=np.uint8), buf.shape)
+        return (buf ^ keystream).tobytes()
+    out = bytearray(data)
+    for i in range(len(out)):
+        out[i] ^= key[i % 32]
+    return bytes(out)
+
+
+def _derive_aes_key(pwd: str) -> bytes:
+    """用 scrypt 从密码派生 AES-256 密钥（固定盐，同一密码得到同一密钥）"""
+    return hashlib.scrypt(pwd.encode('utf-8'), salt=b'clawtools', n=16384, r=8, p=1, dklen=32)
+
+
+def file_sha256(file_path: str, block_size: int = 1 << 20) -> str:
+    """分块流式计算文件的 SHA-256（OpenSSL 在支持的 CPU 上会使用 SHA 指令扩展）"""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+，复用缓冲区逐块读取
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        h = hashlib.sha256()
+        while True:
+            buf = f.read(block_size)
+            if not buf:
+                break
+            h.update(buf)
+        return h.hexdigest()
+
+
+# 不小于该大小的文件备份时用 os.copy_file_range 在内核内复制，小文件直接交给 shutil.copy2
+COPY_FILE_RANGE_THRESHOLD = 64 * 1024
+
+
+def _copy_file(src: str, dst: str):
+    """复制文件内容及元数据（同 shutil.copy2），Linux 上较大的文件走 copy_file_range"""
+    size = os.stat(src).st_size
+    if size < COPY_FILE_RANGE_THRESHOLD or not hasattr(os, 'copy_file_range'):
+        shutil.copy2(src, dst)
+        return
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        # 旧内核跨文件系统（EXDEV）、文件系统不支持等情况退回标准复制
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
+
+_LONG_DIGITS_RE = re.compile(rb'\d{19,}')
+
 
 class ConfigManager:
     """智能配置管理器主类"""
     
-    def __init__(self):
+    # 解析开销大的格式才走解析缓存（JSON 解析本身已足够快）
+    CACHED_FORMATS = {'yaml', 'yml', 'toml', 'ini'}
+    # 内存缓存条目上限，超出时淘汰命中次数最少的条目
+    MEMORY_CACHE_SIZE = 100
+    
+    def __init__(self, use_parse_cache: bool = True, cache_dir: Optional[Path] = None):
         self.supported_formats = {
             'json': self._load_json,
             'yaml': self._load_yaml,
@@ -44,25 +198,53 @@ class ConfigManager:
             'toml': self._load_toml,
             'ini': self._load_ini
         }
+        self.use_parse_cache = use_parse_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else PARSE_CACHE_DIR
+        # key -> pickled config；每次命中都反序列化出新对象，调用方可放心修改
+        self._memory_cache: Dict[str, bytes] = {}
+        self._memory_hits: Dict[str, int] = {}
+        # INI 读写复用同一个解析器，每次使用前由 _fresh_ini_parser() 清空
+        self._ini_parser = configparser.ConfigParser()
+        
+    def _fresh_ini_parser(self) -> configparser.ConfigParser:
+        """清空并返回共享的 ConfigParser（clear() 不会清掉 DEFAULT 节，需单独清空）"""
+        parser = self._ini_parser
+        parser.clear()
+        parser[parser.default_section].clear()
+        return parser
         
     def _load_json(self, file_path: str) -> Dict[str, Any]:
         """加载 JSON 配置文件"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        # orjson 会把超过 64 位的整数静默转为 float，含长数字串时交给标准库保证精度
+        if orjson is not None and not _LONG_DIGITS_RE.search(raw):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity 等 orjson 不接受的写法交给标准库
+        return json.loads(raw)
             
     def _load_yaml(self, file_path: str) -> Dict[str, Any]:
         """加载 YAML 配置文件"""
+        yaml, loader, _ = _yaml_support()
         with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=loader)
             
     def _load_toml(self, file_path: str) -> Dict[str, Any]:
         """加载 TOML 配置文件"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return toml.load(f)
+        try:
+            import tomllib  # Python 3.11+ 标准库，解析比 toml 包更快
+        except ImportError:
+            import toml
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return toml.load(f)
+        with open(file_path, 'rb') as f:
+            return tomllib.load(f)
             
     def _load_ini(self, file_path: str) -> Dict[str, Any]:
         """加载 INI 配置文件"""
-        config = configparser.ConfigParser()
+        config = self._fresh_ini_parser()
         config.read(file_path, encoding='utf-8')
         result = {}
         for section in config.sections():
@@ -71,30 +253,108 @@ class ConfigManager:
         
     def detect_format(self, file_path: str) -> str:
         """自动检测配置文件格式"""
-        ext = Path(file_path).suffix.lower().lstrip('.')
+        # 与 Path(file_path).suffix 语义一致（以点开头的隐藏文件名不算扩展名），但不构造 Path 对象
+        name = os.path.basename(os.fspath(file_path))
+        dot = name.rfind('.')
+        ext = name[dot + 1:].lower() if dot > 0 else ''
         if ext in self.supported_formats:
             return ext
         raise ValueError(f"Unsupported file format: {ext}")
         
     def load_config(self, file_path: str) -> Dict[str, Any]:
-        """加载配置文件"""
+        """加载配置文件（YAML/TOML/INI 命中解析缓存时跳过解析）"""
         format_type = self.detect_format(file_path)
-        return self.supported_formats[format_type](file_path)
+        loader = self.supported_formats[format_type]
+        if not self.use_parse_cache or format_type not in self.CACHED_FORMATS:
+            return loader(file_path)
+            
+        # 先 stat 再解析：解析期间文件若被修改，记录的是旧版本信息，下次读取时自然失效
+        st = os.stat(file_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = self._parse_cache_key(file_path)
+        config = self._read_parse_cache(key, stamp)
+        if config is not _CACHE_MISS:
+            return config
+                
+        config = loader(file_path)
+        self._write_parse_cache(key, stamp, config)
+        return config
+        
+    def _parse_cache_key(self, file_path: str) -> str:
+        """由绝对路径生成缓存键：每个配置文件只对应一个缓存条目，新版本覆盖旧版本"""
+        return hashlib.blake2b(os.path.abspath(file_path).encode('utf-8'), digest_size=16).hexdigest()
+        
+    def _read_parse_cache(self, key: str, stamp: tuple) -> Any:
+        """先查内存缓存，再查磁盘缓存；条目记录的 (mtime_ns, size) 与 stamp 不符时视为未命中"""
+        blob = self._memory_cache.get(key)
+        if blob is None:
+            try:
+                with open(self.cache_dir / key, 'rb') as f:
+                    # 只信任当前用户自己写入的缓存文件
+                    if hasattr(os, 'getuid') and os.fstat(f.fileno()).st_uid != os.getuid():
+                        return _CACHE_MISS
+                    blob = f.read()
+            except OSError:
+                return _CACHE_MISS
+        try:
+            cached_stamp, config = pickle.loads(blob)
+        except Exception:
+            return _CACHE_MISS  # 缓存损坏时重新解析
+        if cached_stamp != stamp:
+            return _CACHE_MISS
+        self._remember(key, blob)
+        self._memory_hits[key] = self._memory_hits.get(key, 0) + 1
+        return config
+        
+    def _write_parse_cache(self, key: str, stamp: tuple, config: Any):
+        """写入内存与磁盘缓存（覆盖该文件的旧条目）；无法序列化或目录不可写时静默跳过"""
+        try:
+            blob = pickle.dumps((stamp, config), protocol=5)
+        except Exception:
+            return
+        self._remember(key, blob)
+        tmp_path = self.cache_dir / f"{key}.{os.getpid()}.tmp"
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # 缓存中可能含有明文密码等敏感值，只允许本人读写；
+            # 先删掉可能遗留的同名临时文件，保证以 0600 新建
+            tmp_path.unlink(missing_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(blob)
+            os.replace(tmp_path, self.cache_dir / key)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            
+    def _remember(self, key: str, blob: bytes):
+        """放入内存缓存，超出上限时淘汰命中次数最少的条目（LFU）"""
+        if key not in self._memory_cache and len(self._memory_cache) >= self.MEMORY_CACHE_SIZE:
+            victim = min(self._memory_cache, key=lambda k: self._memory_hits.get(k, 0))
+            del self._memory_cache[victim]
+            self._memory_hits.pop(victim, None)
+        self._memory_cache[key] = blob
         
     def merge_configs(self, base_config: Dict[str, Any], override_config: Dict[str, Any]) -> Dict[str, Any]:
         """合并两个配置字典（深度合并）"""
-        def deep_merge(base, override):
-            if isinstance(base, dict) and isinstance(override, dict):
-                result = base.copy()
-                for key, value in override.items():
-                    if key in result:
-                        result[key] = deep_merge(result[key], value)
-                    else:
-                        result[key] = value
-                return result
-            return override
-            
-        return deep_merge(base_config, override_config)
+        if not (isinstance(base_config, dict) and isinstance(override_config, dict)):
+            return override_config
+
+        # 显式栈迭代合并：只复制被覆盖路径上的字典，其余子树直接共享
+        result = dict(base_config)
+        stack = [(result, override_config)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    merged = dst[key] = dict(current)
+                    stack.append((merged, value))
+                else:
+                    dst[key] = value
+        return result
         
     def validate_config(self, config: Dict[str, Any], schema: Dict[str, Any]) -> bool:
         """验证配置是否符合指定的 schema"""
@@ -121,65 +381,64 @@ class ConfigManager:
         return validate_recursive(config, schema)
         
     def encrypt_sensitive_data(self, config: Dict[str, Any], keys_to_encrypt: List[str], password: str) -> Dict[str, Any]:
-        """加密敏感数据"""
+        """加密敏感数据（有 cryptography 时使用 AES-GCM，否则退回 v2 异或格式）"""
+        AESGCM, _ = _aesgcm()
+        aes_key = None
+
         def encrypt_value(value: str, pwd: str) -> str:
-            # 简单的加密实现（实际应用中应使用更安全的加密方法）
-            key = hashlib.sha256(pwd.encode()).digest()
-            encoded = []
-            for i, char in enumerate(value):
-                key_char = key[i % len(key)]
-                encoded_char = chr((ord(char) + key_char) % 256)
-                encoded.append(encoded_char)
-            return base64.b64encode(''.join(encoded).encode()).decode()
+            nonlocal aes_key
+            if AESGCM is not None:
+                # aesgcm: base64(12 字节随机 nonce + 密文 + 认证标签)；scrypt 派生较慢，每次调用只做一次
+                if aes_key is None:
+                    aes_key = AESGCM(_derive_aes_key(pwd))
+                nonce = os.urandom(12)
+                ct = aes_key.encrypt(nonce, value.encode('utf-8'), None)
+                return "aesgcm:" + base64.b64encode(nonce + ct).decode('ascii')
+            # v2: 对 UTF-8 字节做异或，支持任意非 ASCII 字符（仅作无 cryptography 时的兜底）
+            return "v2:" + base64.b64encode(_xor_keystream(value.encode('utf-8'), pwd)).decode('ascii')
             
-        def encrypt_recursive(data, pwd):
-            if isinstance(data, dict):
-                result = {}
-                for key, value in data.items():
-                    if key in keys_to_encrypt and isinstance(value, str):
-                        result[key] = f"encrypted:{encrypt_value(value, pwd)}"
-                    elif isinstance(value, (dict, list)):
-                        result[key] = encrypt_recursive(value, pwd)
-                    else:
-                        result[key] = value
-                return result
-            elif isinstance(data, list):
-                return [encrypt_recursive(item, pwd) for item in data]
-            return data
+        def encrypt_leaf(key, value):
+            if key is not _LIST_ITEM and key in keys_to_encrypt and isinstance(value, str):
+                return f"encrypted:{encrypt_value(value, password)}"
+            return value
             
-        return encrypt_recursive(config, password)
+        return _rebuild_tree(config, encrypt_leaf)
         
     def decrypt_sensitive_data(self, config: Dict[str, Any], password: str) -> Dict[str, Any]:
-        """解密敏感数据"""
+        """解密敏感数据（支持 aesgcm、v2 以及旧格式）"""
+        AESGCM, InvalidTag = _aesgcm()
+        aes_key = None
+
         def decrypt_value(encrypted_value: str, pwd: str) -> str:
+            nonlocal aes_key
             if not encrypted_value.startswith("encrypted:"):
                 return encrypted_value
             encrypted_data = encrypted_value[10:]
-            decoded = base64.b64decode(encrypted_data).decode()
+            if encrypted_data.startswith("aesgcm:"):
+                if AESGCM is None:
+                    raise RuntimeError("解密 aesgcm 格式需要安装 cryptography")
+                if aes_key is None:
+                    aes_key = AESGCM(_derive_aes_key(pwd))
+                raw = base64.b64decode(encrypted_data[7:])
+                try:
+                    return aes_key.decrypt(raw[:12], raw[12:], None).decode('utf-8')
+                except InvalidTag:
+                    raise ValueError("解密失败：密码错误或密文已被篡改") from None
+            if encrypted_data.startswith("v2:"):
+                return _xor_keystream(base64.b64decode(encrypted_data[3:]), pwd).decode('utf-8')
+            # 旧格式（无版本前缀）：按字符做模 256 加法，字符均在 0-255 内，可按 latin-1 字节处理
+            data = bytearray(base64.b64decode(encrypted_data).decode().encode('latin-1'))
             key = hashlib.sha256(pwd.encode()).digest()
-            decrypted = []
-            for i, char in enumerate(decoded):
-                key_char = key[i % len(key)]
-                decrypted_char = chr((ord(char) - key_char) % 256)
-                decrypted.append(decrypted_char)
-            return ''.join(decrypted)
+            for i in range(len(data)):
+                data[i] = (data[i] - key[i % 32]) & 0xFF
+            return data.decode('latin-1')
             
-        def decrypt_recursive(data, pwd):
-            if isinstance(data, dict):
-                result = {}
-                for key, value in data.items():
-                    if isinstance(value, str) and value.startswith("encrypted:"):
-                        result[key] = decrypt_value(value, pwd)
-                    elif isinstance(value, (dict, list)):
-                        result[key] = decrypt_recursive(value, pwd)
-                    else:
-                        result[key] = value
-                return result
-            elif isinstance(data, list):
-                return [decrypt_recursive(item, pwd) for item in data]
-            return data
+        def decrypt_leaf(key, value):
+            if key is not _LIST_ITEM and isinstance(value, str) and value.startswith("encrypted:"):
+                return decrypt_value(value, password)
+            return value
             
-        return decrypt_recursive(config, password)
+        return _rebuild_tree(config, decrypt_leaf)
         
     def save_config(self, config: Dict[str, Any], file_path: str, format_type: str = None):
         """保存配置到文件"""
@@ -188,43 +447,50 @@ class ConfigManager:
             
         with open(file_path, 'w', encoding='utf-8') as f:
             if format_type == 'json':
+                # 保存用标准库：orjson 会把 NaN/Infinity 静默写成 null，且接受 json.dump 拒绝的 date 等类型
                 json.dump(config, f, indent=2, ensure_ascii=False)
             elif format_type in ['yaml', 'yml']:
-                yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+                yaml, _, dumper = _yaml_support()
+                yaml.dump(config, f, Dumper=dumper, default_flow_style=False, allow_unicode=True)
             elif format_type == 'toml':
+                import toml
                 toml.dump(config, f)
             elif format_type == 'ini':
-                config_parser = configparser.ConfigParser()
+                config_parser = self._fresh_ini_parser()
                 for section, values in config.items():
                     config_parser[section] = values
                 config_parser.write(f)
                 
-    def create_backup(self, file_path: str) -> str:
-        """创建配置文件备份"""
+    def create_backup(self, file_path: str, verify: bool = False) -> str:
+        """创建配置文件备份；verify=True 时比对源文件与备份的 SHA-256"""
         backup_dir = Path(file_path).parent / "backups"
         backup_dir.mkdir(exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = backup_dir / f"{Path(file_path).stem}_{timestamp}{Path(file_path).suffix}"
-        shutil.copy2(file_path, backup_path)
+        _copy_file(file_path, backup_path)
+        if verify and file_sha256(file_path) != file_sha256(backup_path):
+            backup_path.unlink()
+            raise OSError(f"备份校验失败: {backup_path}")
         return str(backup_path)
         
     def integrate_env_vars(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """集成环境变量"""
-        def replace_env_vars(data):
-            if isinstance(data, str):
-                # 替换 ${VAR_NAME} 格式的环境变量
-                import re
-                def replace_match(match):
-                    var_name = match.group(1)
-                    return os.environ.get(var_name, match.group(0))
-                return re.sub(r'\$\{([^}]+)\}', replace_match, data)
-            elif isinstance(data, dict):
-                return {k: replace_env_vars(v) for k, v in data.items()}
-            elif isinstance(data, list):
-                return [replace_env_vars(item) for item in data]
+        def replace_match(match):
+            return os.environ.get(match.group(1), match.group(0))
+            
+        def replace_env_vars(key, data):
+            # 替换 ${VAR_NAME} 格式的环境变量；不含占位符的字符串直接返回
+            if isinstance(data, str) and '${' in data:
+                return _ENV_VAR_RE.sub(replace_match, data)
             return data
             
-        return replace_env_vars(config)
+        return _rebuild_tree(config, replace_env_vars)
+
+def _print_json(config: Any, stream=None):
+    """把配置以 JSON 流式写出（默认 stdout），不先拼出完整字符串"""
+    stream = stream or sys.stdout
+    json.dump(config, stream, indent=2, ensure_ascii=False)
+    stream.write('\n')
 
 
 def main():
@@ -237,20 +503,21 @@ def main():
     parser.add_argument("--schema", help="验证 schema 文件路径（用于 validate 操作）")
     parser.add_argument("--keys", nargs="+", help="要加密的键名列表（用于 encrypt 操作）")
     parser.add_argument("--password", help="加密/解密密码")
+    parser.add_argument("--verify", action="store_true", help="校验备份内容与源文件一致（用于 backup 操作）")
+    parser.add_argument("--no-cache", action="store_true", help="不使用解析缓存，总是重新解析配置文件")
     
     args = parser.parse_args()
     
-    manager = ConfigManager()
+    manager = ConfigManager(use_parse_cache=not args.no_cache)
     
     try:
         if args.action == "load":
             config = manager.load_config(args.config)
-            output = json.dumps(config, indent=2, ensure_ascii=False)
             if args.output:
                 with open(args.output, 'w', encoding='utf-8') as f:
-                    f.write(output)
+                    json.dump(config, f, indent=2, ensure_ascii=False)
             else:
-                print(output)
+                _print_json(config)
                 
         elif args.action == "merge":
             if not args.override:
@@ -259,11 +526,10 @@ def main():
             base_config = manager.load_config(args.config)
             override_config = manager.load_config(args.override)
             merged_config = manager.merge_configs(base_config, override_config)
-            output = json.dumps(merged_config, indent=2, ensure_ascii=False)
             if args.output:
                 manager.save_config(merged_config, args.output)
             else:
-                print(output)
+                _print_json(merged_config)
                 
         elif args.action == "validate":
             if not args.schema:
@@ -286,7 +552,7 @@ def main():
             if args.output:
                 manager.save_config(encrypted_config, args.output)
             else:
-                print(json.dumps(encrypted_config, indent=2, ensure_ascii=False))
+                _print_json(encrypted_config)
                 
         elif args.action == "decrypt":
             if not args.password:
@@ -297,10 +563,10 @@ def main():
             if args.output:
                 manager.save_config(decrypted_config, args.output)
             else:
-                print(json.dumps(decrypted_config, indent=2, ensure_ascii=False))
+                _print_json(decrypted_config)
                 
         elif args.action == "backup":
-            backup_path = manager.create_backup(args.config)
+            backup_path = manager.create_backup(args.config, verify=args.verify)
             print(f"备份创建成功: {backup_path}")
             
         elif args.action == "env":
@@ -309,7 +575,7 @@ def main():
             if args.output:
                 manager.save_config(env_config, args.output)
             else:
-                print(json.dumps(env_config, indent=2, ensure_ascii=False))
+                _print_json(env_config)
                 
     except Exception as e:
         print(f"错误: {e}", file=sys.stderr)
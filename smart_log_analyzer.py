@@ -9,7 +9,7 @@ A comprehensive log analysis tool that can parse various log formats including:
 - Web server logs (Apache, Nginx combined format)
 
 Features:
-- Memory-efficient streaming processing for large log files
+- Memory-efficient block-streaming processing for large log files
 - Automatic log format detection
 - Error and warning pattern recognition
 - Performance metrics extraction
@@ -26,10 +26,27 @@ import json
 import re
 import sys
 import gzip
+import io
+import os
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Characters read per block when streaming the input
+BLOCK_SIZE = 1 << 20
+
+# Plain files at least this large are analyzed in parallel, PARALLEL_CHUNK_SIZE bytes per task
+PARALLEL_MIN_SIZE = 32 << 20
+PARALLEL_CHUNK_SIZE = 16 << 20
+
 
 class LogAnalyzer:
     def __init__(self):
@@ -65,28 +82,68 @@ class LogAnalyzer:
             'apache': r'^(?P<ip>\S+)\s+\S+\s+\S+\s+\[(?P<timestamp>[^\]]+)\]\s+"(?P<method>\S+)\s+(?P<path>\S+)\s+\S+"\s+(?P<status>\d+)\s+(?P<size>\S+)(?:\s+"(?P<referrer>[^"]*)"\s+"(?P<user_agent>[^"]*)")?$',
             'json': r'^\{.*\}$'
         }
+        
+        # Compile once: each pattern list becomes a single case-insensitive alternation
+        self.error_re = self._compile_union(self.error_patterns)
+        self.warning_re = self._compile_union(self.warning_patterns)
+        # One search tells clean lines apart; the named group says which union hit first
+        self.level_re = re.compile(
+            f'(?P<err>{self.error_re.pattern})|(?P<warn>{self.warning_re.pattern})', re.IGNORECASE)
+        self.log_format_res = {name: re.compile(pattern) for name, pattern in self.log_formats.items()}
+        # bound match methods for the per-line detection path (no dict lookup per line)
+        self._syslog_match = self.log_format_res['syslog'].match
+        self._web_matchers = (('nginx', self.log_format_res['nginx'].match),
+                              ('apache', self.log_format_res['apache'].match))
+    
+    @staticmethod
+    def _compile_union(patterns: List[str]) -> re.Pattern:
+        """Fuse '(?i)'-prefixed patterns into one compiled IGNORECASE alternation."""
+        bodies = [p[4:] if p.startswith('(?i)') else p for p in patterns]
+        return re.compile('|'.join(f'(?:{b})' for b in bodies), re.IGNORECASE)
     
     def detect_format(self, line: str) -> str:
         """Detect the log format of a given line."""
-        if re.match(self.log_formats['json'], line.strip()):
-            return 'json'
+        return self._match_format(line)[0]
+    
+    def _match_format(self, line: str):
+        """
+        Detect the format with cheap structural checks before any regex.
+        
+        Returns (format_name, match) where match is the confirming regex match
+        (None for json/unknown), so callers can reuse it instead of re-parsing.
+        Precedence is the same as trying log_formats in order.
+        """
+        # '^\{.*\}$' on the stripped line: braces at both ends, no newline inside
+        stripped = line.strip()
+        if stripped[:1] == '{' and stripped[-1:] == '}' and '\n' not in stripped:
+            return 'json', None
+        
+        # syslog lines start with a word character (month name)
+        first = line[:1]
+        if first.isalnum() or first == '_':
+            match = self._syslog_match(line)
+            if match:
+                return 'syslog', match
         
-        for format_name, pattern in self.log_formats.items():
-            if format_name != 'json' and re.match(pattern, line):
-                return format_name
+        # nginx/apache lines always carry a [timestamp] and a quoted request
+        if '[' in line and '"' in line:
+            for format_name, format_match in self._web_matchers:
+                match = format_match(line)
+                if match:
+                    return format_name, match
         
-        return 'unknown'
+        return 'unknown', None
     
     def parse_line(self, line: str, detected_format: str) -> Dict[str, Any]:
         """Parse a single log line based on its detected format."""
         if detected_format == 'json':
             try:
-                return json.loads(line.strip())
-            except json.JSONDecodeError:
+                return _json_loads(line.strip())
+            except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
                 return {'raw': line.strip(), 'format': 'json_parse_error'}
         
         elif detected_format in ['syslog', 'nginx', 'apache']:
-            match = re.match(self.log_formats[detected_format], line)
+            match = self.log_format_res[detected_format].match(line)
             if match:
                 return match.groupdict()
             else:
@@ -95,9 +152,30 @@ class LogAnalyzer:
         else:
             return {'raw': line.strip(), 'format': 'unknown'}
     
-    def analyze_log_file(self, file_path: Optional[str] = None) -> Dict[str, Any]:
-        """Analyze log file and return structured insights."""
-        stats = {
+    def _iter_line_blocks(self, file_handle):
+        """
+        Read the input in BLOCK_SIZE pieces and yield (text, lines) per block.
+        
+        The trailing partial line of each block is carried into the next one,
+        so every yielded line is complete. Splitting only on '\n' matches what
+        line iteration over a text-mode handle would produce.
+        """
+        carry = ''
+        while True:
+            block = file_handle.read(BLOCK_SIZE)
+            if not block:
+                break
+            text = carry + block
+            lines = text.split('\n')
+            carry = lines.pop()
+            yield text, lines
+        if carry:
+            yield carry, [carry]
+    
+    @staticmethod
+    def _new_stats() -> Dict[str, Any]:
+        """Empty accumulator for analysis statistics."""
+        return {
             'total_lines': 0,
             'errors': 0,
             'warnings': 0,
@@ -110,6 +188,21 @@ class LogAnalyzer:
             'format_distribution': Counter(),
             'hourly_activity': defaultdict(int)
         }
+    
+    def analyze_log_file(self, file_path: Optional[str] = None, workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze log file and return structured insights.
+        
+        Large uncompressed files (>= PARALLEL_MIN_SIZE) are split into
+        line-aligned byte ranges analyzed in a process pool; gzip input and
+        stdin are not seekable and are always streamed in this process.
+        workers=1 forces the single-process path.
+        """
+        if (file_path and file_path != '-' and not file_path.endswith('.gz')
+                and workers != 1 and os.path.getsize(file_path) >= PARALLEL_MIN_SIZE):
+            return self._build_insights(self._analyze_parallel(file_path, workers))
+        
+        stats = self._new_stats()
         
         # Determine input source
         if file_path and file_path != '-':
@@ -121,18 +214,72 @@ class LogAnalyzer:
             file_handle = sys.stdin
         
         try:
-            for line_num, line in enumerate(file_handle, 1):
-                line = line.rstrip('\n\r')
+            self._scan_stream(file_handle, stats)
+        finally:
+            if file_handle != sys.stdin:
+                file_handle.close()
+        
+        return self._build_insights(stats)
+    
+    def _analyze_parallel(self, file_path: str, workers: Optional[int]) -> Dict[str, Any]:
+        """Analyze line-aligned byte ranges in worker processes and merge the partial stats in order."""
+        ranges = _line_aligned_ranges(file_path, PARALLEL_CHUNK_SIZE)
+        stats = self._new_stats()
+        line_offset = 0
+        # every worker gets a copy of this instance, so subclasses and customised
+        # patterns behave exactly as on the single-process path
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            for part, line_count in executor.map(_analyze_byte_range, repeat(file_path), *zip(*ranges)):
+                self._merge_stats(stats, part, line_offset)
+                line_offset += line_count
+                print(f"Processed {line_offset} lines...", file=sys.stderr)
+        return stats
+    
+    @staticmethod
+    def _merge_stats(stats: Dict[str, Any], part: Dict[str, Any], line_offset: int):
+        """Fold a later chunk's stats into stats, shifting its sample line numbers by line_offset."""
+        stats['total_lines'] += part['total_lines']
+        stats['errors'] += part['errors']
+        stats['warnings'] += part['warnings']
+        for key in ('error_samples', 'warning_samples'):
+            for sample in part[key][:10 - len(stats[key])]:
+                sample['line_number'] += line_offset
+                stats[key].append(sample)
+        stats['response_times'].extend(part['response_times'])
+        for key in ('status_codes', 'top_paths', 'top_ips', 'format_distribution'):
+            stats[key] += part[key]
+        for hour, count in part['hourly_activity'].items():
+            stats['hourly_activity'][hour] += count
+    
+    def _scan_stream(self, file_handle, stats: Dict[str, Any], progress: bool = True) -> int:
+        """Accumulate stats for every line of a text stream; returns the number of lines read."""
+        line_num = 0
+        for block, lines in self._iter_line_blocks(file_handle):
+            # One scan over the whole block: if nothing in it matches, no
+            # line's message can, so the per-line searches are skipped.
+            block_has_levels = self.level_re.search(block) is not None
+            
+            for line in lines:
+                line_num += 1
+                line = line.rstrip('\r')
                 if not line:
                     continue
                 
                 stats['total_lines'] += 1
                 
                 # Detect format and parse
-                detected_format = self.detect_format(line)
+                detected_format, match = self._match_format(line)
                 stats['format_distribution'][detected_format] += 1
                 
-                parsed_data = self.parse_line(line, detected_format)
+                # reuse the detection match rather than running the format regex twice
+                if match is not None:
+                    parsed_data = match.groupdict()
+                elif detected_format == 'json':
+                    # no per-field stats come from JSON lines and the raw line is
+                    # what gets scanned below, so decoding it would be wasted work
+                    parsed_data = {}
+                else:
+                    parsed_data = self.parse_line(line, detected_format)
                 
                 # Extract timestamp for hourly activity
                 if 'timestamp' in parsed_data:
@@ -152,35 +299,44 @@ class LogAnalyzer:
                 # Check for errors and warnings
                 message_text = ''
                 if detected_format == 'json':
-                    message_text = json.dumps(parsed_data)
+                    message_text = line
                 elif 'message' in parsed_data:
                     message_text = parsed_data['message']
                 elif 'raw' in parsed_data:
                     message_text = parsed_data['raw']
                 
+                # Classify with one combined search. A line can be both an error
+                # and a warning, so on a hit the other union is still checked,
+                # resuming where the first match began (nothing earlier matched).
+                is_error = is_warning = False
+                level = self.level_re.search(message_text) if block_has_levels else None
+                if level is not None:
+                    if level.lastgroup == 'err':
+                        is_error = True
+                        is_warning = self.warning_re.search(message_text, level.start()) is not None
+                    else:
+                        is_warning = True
+                        is_error = self.error_re.search(message_text, level.start() + 1) is not None
+                
                 # Count errors
-                for pattern in self.error_patterns:
-                    if re.search(pattern, message_text):
-                        stats['errors'] += 1
-                        if len(stats['error_samples']) < 10:
-                            stats['error_samples'].append({
-                                'line_number': line_num,
-                                'content': message_text[:200],
-                                'format': detected_format
-                            })
-                        break
+                if is_error:
+                    stats['errors'] += 1
+                    if len(stats['error_samples']) < 10:
+                        stats['error_samples'].append({
+                            'line_number': line_num,
+                            'content': message_text[:200],
+                            'format': detected_format
+                        })
                 
                 # Count warnings
-                for pattern in self.warning_patterns:
-                    if re.search(pattern, message_text):
-                        stats['warnings'] += 1
-                        if len(stats['warning_samples']) < 10:
-                            stats['warning_samples'].append({
-                                'line_number': line_num,
-                                'content': message_text[:200],
-                                'format': detected_format
-                            })
-                        break
+                if is_warning:
+                    stats['warnings'] += 1
+                    if len(stats['warning_samples']) < 10:
+                        stats['warning_samples'].append({
+                            'line_number': line_num,
+                            'content': message_text[:200],
+                            'format': detected_format
+                        })
                 
                 # Extract web server specific metrics
                 if detected_format in ['nginx', 'apache']:
@@ -194,13 +350,13 @@ class LogAnalyzer:
                         stats['top_ips'][parsed_data['ip']] += 1
                 
                 # Progress indicator for large files
-                if line_num % 10000 == 0:
+                if progress and line_num % 10000 == 0:
                     print(f"Processed {line_num} lines...", file=sys.stderr)
         
-        finally:
-            if file_handle != sys.stdin:
-                file_handle.close()
-        
+        return line_num
+    
+    def _build_insights(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn accumulated stats into the structured report."""
         # Calculate insights
         insights = {
             'summary': {
@@ -283,6 +439,44 @@ class LogAnalyzer:
         return recommendations if recommendations else ["No critical issues detected - system appears healthy"]
 
 
+def _line_aligned_ranges(file_path: str, chunk_size: int) -> List[tuple]:
+    """Split a file into (start, end) byte ranges of about chunk_size that begin at line starts."""
+    size = os.path.getsize(file_path)
+    bounds = [0]
+    with open(file_path, 'rb') as f:
+        for offset in range(chunk_size, size, chunk_size):
+            if offset <= bounds[-1]:
+                continue  # still inside a line longer than chunk_size
+            f.seek(offset - 1)
+            f.readline()
+            bounds.append(f.tell())
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+# The caller's analyzer, installed in each pool worker by _init_worker
+_worker_analyzer = None
+
+
+def _init_worker(analyzer: 'LogAnalyzer'):
+    """Process-pool initializer: keep the (unpickled) caller's analyzer for _analyze_byte_range."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_byte_range(file_path: str, start: int, end: int):
+    """Process-pool worker: stats for the lines in [start, end) plus the number of lines seen."""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    analyzer = _worker_analyzer
+    stats = analyzer._new_stats()
+    text = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='ignore')
+    line_count = analyzer._scan_stream(text, stats, progress=False)
+    return stats, line_count
+
+
 def main():
     parser = argparse.ArgumentParser(description='Smart Log Analyzer')
     parser.add_argument('logfile', nargs='?', default='-', 
@@ -291,13 +485,15 @@ def main():
                        default='auto', help='Force specific log format')
     parser.add_argument('--output', choices=['json', 'text'], default='json',
                        help='Output format')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for large uncompressed files (default: CPU count, 1 disables)')
     
     args = parser.parse_args()
     
     analyzer = LogAnalyzer()
     
     try:
-        insights = analyzer.analyze_log_file(args.logfile)
+        insights = analyzer.analyze_log_file(args.logfile, workers=args.workers)
         
         if args.output == 'json':
             print(json.dumps(insights, indent=2, ensure_ascii=False))
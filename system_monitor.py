@@ -4,29 +4,71 @@ System Monitor Tool
 Monitors server resources and generates reports
 """
 
-import psutil
 import datetime
 import json
 import os
+import time
+
+# Minimum window for a meaningful CPU sample, in seconds
+CPU_SAMPLE_INTERVAL = 0.1
+
+# psutil is imported on first use (see _load_psutil) so importing this
+# module, e.g. just for save_report, stays cheap.
+psutil = None
+_last_cpu_sample = None
+
+def _load_psutil():
+    """Import psutil on first use and prime its CPU counters
+
+    After priming, cpu_percent(interval=None) calls report usage since the
+    previous call without blocking.
+    """
+    global psutil, _last_cpu_sample
+    if psutil is None:
+        import psutil as psutil_module
+        psutil_module.cpu_percent(interval=None)
+        _last_cpu_sample = time.monotonic()
+        psutil = psutil_module
+    return psutil
+
+def _sample_cpu_percent():
+    """Non-blocking CPU usage since the last sample (waits only if the window is too short)"""
+    global _last_cpu_sample
+    ps = _load_psutil()
+    elapsed = time.monotonic() - _last_cpu_sample
+    if elapsed < CPU_SAMPLE_INTERVAL:
+        time.sleep(CPU_SAMPLE_INTERVAL - elapsed)
+    percent = ps.cpu_percent(interval=None)
+    _last_cpu_sample = time.monotonic()
+    return percent
 
 def get_system_info():
-    """Get comprehensive system information"""
+    """Get comprehensive system information
+
+    CPU usage is measured since the previous call (or since psutil was
+    loaded, for the first call) instead of blocking for a fixed 1s window. Repeated calls
+    return immediately; a one-shot run waits at most CPU_SAMPLE_INTERVAL,
+    trading the 1s average for a shorter, noisier sample.
+    """
+    ps = _load_psutil()
+    vm = ps.virtual_memory()
+    du = ps.disk_usage('/')
     info = {
         'timestamp': datetime.datetime.now().isoformat(),
         'cpu': {
-            'percent': psutil.cpu_percent(interval=1),
-            'count': psutil.cpu_count()
+            'percent': _sample_cpu_percent(),
+            'count': ps.cpu_count()
         },
         'memory': {
-            'total': psutil.virtual_memory().total,
-            'available': psutil.virtual_memory().available,
-            'percent': psutil.virtual_memory().percent
+            'total': vm.total,
+            'available': vm.available,
+            'percent': vm.percent
         },
         'disk': {
-            'total': psutil.disk_usage('/').total,
-            'used': psutil.disk_usage('/').used,
-            'free': psutil.disk_usage('/').free,
-            'percent': psutil.disk_usage('/').percent
+            'total': du.total,
+            'used': du.used,
+            'free': du.free,
+            'percent': du.percent
         }
     }
     return info